@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Script to profile the CLI test suite with Scalene.
+
+Runs ``pytest tests/test_cli.py`` under Scalene and fails if the fraction of
+CPU time spent in Python code (as opposed to native code) exceeds a threshold.
+
+Usage:
+    python scripts/profile_cli_tests.py [--threshold PERCENT] [--outfile PATH]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_scalene(outfile: Path) -> None:
+    """Run the CLI tests under Scalene and write the JSON profile.
+
+    Args:
+        outfile: Path of the JSON profile to write.
+    """
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "scalene",
+            "run",
+            "--cpu-only",
+            "--profile-all",
+            "--outfile",
+            str(outfile),
+            "-m",
+            "pytest",
+            "---",
+            "tests/test_cli.py",
+            "-q",
+            # Scalene only samples the main process.
+            "-n0",
+        ],
+        cwd=REPO_ROOT,
+        check=True,
+    )
+
+
+def python_percent(profile: dict) -> float:
+    """Compute the share of sampled CPU time spent in Python code.
+
+    Args:
+        profile: Parsed Scalene JSON profile.
+
+    Returns:
+        Python CPU time as a percentage of Python plus native CPU time.
+    """
+    python = native = 0.0
+    for file in profile.get("files", {}).values():
+        for line in file["lines"]:
+            python += line["n_cpu_percent_python"]
+            native += line["n_cpu_percent_c"]
+    total = python + native
+    return 100.0 * python / total if total else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=90.0,
+        help="Maximum allowed Python CPU time percentage (default: 90)",
+    )
+    parser.add_argument(
+        "--outfile",
+        type=Path,
+        default=REPO_ROOT / "scalene-profile.json",
+        help="Path of the Scalene JSON profile",
+    )
+    args = parser.parse_args()
+
+    run_scalene(args.outfile)
+    percent = python_percent(json.loads(args.outfile.read_text()))
+    print(f"Python CPU time: {percent:.1f}% (threshold: {args.threshold:.1f}%)")
+    if percent > args.threshold:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
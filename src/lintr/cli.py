@@ -1,19 +1,36 @@
 """Command-line interface for Lintr."""
 
 import argparse
+import functools
 import shutil
 import sys
 from pathlib import Path
 
 from lintr import __version__
-from lintr.config import create_config_class
 
 # Path to the default configuration template
 DEFAULT_CONFIG_TEMPLATE = Path(__file__).parent / "templates" / "default_config.yml"
 
 
+def positive_int(value: str) -> int:
+    """Parse a command-line argument as an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.cache
 def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser for the CLI."""
+    """Create the argument parser for the CLI.
+
+    The parser is built once and reused, since parsing does not modify it.
+    """
+    from lintr.linter import MAX_WORKERS
+
     parser = argparse.ArgumentParser(
         description="Lintr - A tool to lint and enforce consistent settings across GitHub repositories.",
         prog="lintr",
@@ -47,6 +64,17 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show what would be done without making changes",
     )
+    lint_parser.add_argument(
+        "--max-workers",
+        type=positive_int,
+        default=MAX_WORKERS,
+        help=(
+            "Maximum number of repositories to lint concurrently (default: %(default)s). "
+            "If linting a repository fails, the remaining repositories are still "
+            "linted, and fixed with --fix --non-interactive, before the first error "
+            "is reported"
+        ),
+    )
 
     # List command
     list_parser = subparsers.add_parser(
@@ -84,6 +112,8 @@ def handle_lint(args: argparse.Namespace) -> None:
         #     sys.exit(1)
 
         # Load and validate configuration from all sources
+        from lintr.config import create_config_class
+
         LintrConfig = create_config_class(config_path)
         config = LintrConfig()
 
@@ -131,6 +161,7 @@ def handle_lint(args: argparse.Namespace) -> None:
                 dry_run=args.dry_run,
                 non_interactive=args.non_interactive,
                 fix=args.fix,
+                max_workers=args.max_workers,
             )
             linter.lint_repositories(repos)
 
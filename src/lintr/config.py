@@ -1,15 +1,31 @@
 """Configuration management for lintr."""
 
+import copy
+import functools
+import hashlib
+import re
+from collections import OrderedDict
+from fnmatch import translate
 from pathlib import Path
+from typing import Any
 
+import yaml
 from pydantic import AliasChoices, BaseModel, Field, ValidationError
 from pydantic_core import PydanticCustomError
 from pydantic_settings import (
     BaseSettings,
+    InitSettingsSource,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
-from pydantic_settings.sources import YamlConfigSettingsSource
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+# Maximum number of configuration classes kept by create_config_class.
+CONFIG_CLASS_CACHE_SIZE = 100
 
 
 class RepositoryFilter(BaseModel):
@@ -18,6 +34,31 @@ class RepositoryFilter(BaseModel):
     include_patterns: list[str] = Field(default_factory=list)
     exclude_patterns: list[str] = Field(default_factory=list)
 
+    def matches(self, name: str) -> bool:
+        """Check whether a repository name passes the filter.
+
+        Args:
+            name: Repository name.
+
+        Returns:
+            True if the name matches any include pattern, or there are none, and
+            matches no exclude pattern.
+        """
+        if self.include_patterns and not _compile_patterns(
+            tuple(self.include_patterns)
+        ).match(name):
+            return False
+        return not (
+            self.exclude_patterns
+            and _compile_patterns(tuple(self.exclude_patterns)).match(name)
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile glob patterns into a single regular expression matching any of them."""
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
 
 class RuleSetConfig(BaseModel):
     """Configuration for a rule set."""
@@ -72,20 +113,62 @@ class BaseLintrConfig(BaseSettings):
     )
 
 
-def create_config_class(yaml_file: Path | None = None) -> type[BaseLintrConfig]:
+# Configuration classes created by create_config_class, keyed by the resolved YAML
+# file path, modification time and size, or by a hash of the YAML content, from
+# least to most recently used.
+_config_class_cache: OrderedDict[
+    tuple[str, int, int] | str | None, type[BaseLintrConfig]
+] = OrderedDict()
+
+
+def create_config_class(
+    yaml_file: Path | None = None, yaml_content: str | None = None
+) -> type[BaseLintrConfig]:
     """Create a configuration class with a specific YAML file path.
 
+    Classes are cached, so repeated calls for an unchanged file return the same
+    class, which parses the YAML file only once.
+
     Args:
         yaml_file: Path to the YAML configuration file.
+        yaml_content: YAML configuration as a string. Takes precedence over
+            yaml_file if both are given.
 
     Returns:
-        A configuration class that includes the specified YAML file.
+        A configuration class that includes the specified YAML configuration.
 
     Raises:
         FileNotFoundError: If yaml_file is specified but doesn't exist.
     """
-    if yaml_file and not yaml_file.exists():
-        raise FileNotFoundError(f"Config file not found: {yaml_file}")
+    if yaml_content is not None:
+        key = hashlib.sha256(yaml_content.encode()).hexdigest()
+        yaml_file = None
+    elif yaml_file:
+        if not yaml_file.exists():
+            raise FileNotFoundError(f"Config file not found: {yaml_file}")
+        stat = yaml_file.stat()
+        key = (str(yaml_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    else:
+        key = None
+
+    config_class = _config_class_cache.get(key)
+    if config_class is not None:
+        _config_class_cache.move_to_end(key)
+        return config_class
+
+    config_class = _build_config_class(yaml_file, yaml_content)
+    _config_class_cache[key] = config_class
+    if len(_config_class_cache) > CONFIG_CLASS_CACHE_SIZE:
+        _config_class_cache.popitem(last=False)
+    return config_class
+
+
+def _build_config_class(
+    yaml_file: Path | None, yaml_content: str | None
+) -> type[BaseLintrConfig]:
+    """Build a new configuration class for the given YAML file or content."""
+    # Parsed YAML configuration, read on first instantiation.
+    yaml_data: dict[str, Any] | None = None
 
     class LintrConfig(BaseLintrConfig):
         """Configuration for lintr."""
@@ -106,13 +189,24 @@ def create_config_class(yaml_file: Path | None = None) -> type[BaseLintrConfig]:
             2. .env file
             3. YAML config file
             """
-            if yaml_file:
+            nonlocal yaml_data, yaml_content
+
+            if yaml_data is None:
+                if not yaml_file and yaml_content is None:
+                    return (init_settings, env_settings, dotenv_settings)
+
                 try:
-                    yaml_settings = YamlConfigSettingsSource(
-                        settings_cls=settings_cls,
-                        yaml_file=yaml_file,
-                    )
-                    return (init_settings, env_settings, dotenv_settings, yaml_settings)
+                    if yaml_content is not None:
+                        data = yaml.load(yaml_content, Loader=YamlLoader)
+                    else:
+                        with yaml_file.open(encoding="utf-8") as f:
+                            data = yaml.load(f, Loader=YamlLoader)
+                    data = data or {}
+                    if not isinstance(data, dict):
+                        raise TypeError("YAML configuration must be a mapping")
+                    yaml_data = data
+                    # The parsed data is all that is needed from now on.
+                    yaml_content = None
                 except Exception as e:
                     raise ValidationError.from_exception_data(
                         title="YAML parsing error",
@@ -121,11 +215,15 @@ def create_config_class(yaml_file: Path | None = None) -> type[BaseLintrConfig]:
                                 type=PydanticCustomError(
                                     "yaml_validation_error",
                                     "Error while parsing YAML file {file}",
-                                    dict(file=yaml_file),
+                                    dict(file=yaml_file or "<string>"),
                                 )
                             )
                         ],
                     ) from e
-            return (init_settings, env_settings, dotenv_settings)
+
+            # Each instance gets its own copy, so that mutating nested values of
+            # one configuration does not leak into later instances.
+            yaml_settings = InitSettingsSource(settings_cls, copy.deepcopy(yaml_data))
+            return (init_settings, env_settings, dotenv_settings, yaml_settings)
 
     return LintrConfig
@@ -1,12 +1,33 @@
 """GitHub API integration for Lintr."""
 
-from fnmatch import fnmatch
+from operator import attrgetter
 
-from github import Github
+from github import Auth, Github
 from github.Repository import Repository
 from pydantic import BaseModel
 from lintr.config import RepositoryFilter
 
+# Number of items per page when listing from the GitHub API (the API maximum).
+PER_PAGE = 100
+
+# Repository attributes reported by GitHubClient.get_repository_settings.
+_SETTINGS_KEYS = (
+    "name",
+    "default_branch",
+    "description",
+    "homepage",
+    "private",
+    "archived",
+    "has_issues",
+    "has_projects",
+    "has_wiki",
+    "allow_squash_merge",
+    "allow_merge_commit",
+    "allow_rebase_merge",
+    "delete_branch_on_merge",
+)
+_get_settings = attrgetter(*_SETTINGS_KEYS)
+
 
 class GitHubConfig(BaseModel):
     """Configuration for GitHub API access."""
@@ -29,7 +50,8 @@ class GitHubClient:
             config: GitHub configuration.
         """
         self._config = config
-        self._client = Github(config.token)
+        # A single client is shared by all requests, so its session is reused.
+        self._client = Github(auth=Auth.Token(config.token), per_page=PER_PAGE)
 
     def get_repositories(self) -> list[Repository]:
         """Get list of repositories based on configuration.
@@ -63,31 +85,12 @@ class GitHubClient:
             and (self._config.include_archived or not repo.archived)
         ]
 
-        # Apply repository filters if configured
-        if self._config.repository_filter.include_patterns:
-            filtered_repos = [
-                repo
-                for repo in filtered_repos
-                if not self._config.repository_filter.include_patterns
-                or any(
-                    fnmatch(repo.name, pattern)
-                    for pattern in self._config.repository_filter.include_patterns
-                )
-            ]
-
-        # Apply exclusion patterns if specified
-        if self._config.repository_filter.exclude_patterns:
-            filtered_repos = [
-                repo
-                for repo in filtered_repos
-                if not self._config.repository_filter.exclude_patterns
-                or not any(
-                    fnmatch(repo.name, pattern)
-                    for pattern in self._config.repository_filter.exclude_patterns
-                )
-            ]
-
-        return filtered_repos
+        # Apply inclusion and exclusion patterns
+        return [
+            repo
+            for repo in filtered_repos
+            if self._config.repository_filter.matches(repo.name)
+        ]
 
     def get_repository_settings(self, repo: Repository) -> dict:
         """Get settings for a repository.
@@ -98,18 +101,4 @@ class GitHubClient:
         Returns:
             Dictionary containing repository settings.
         """
-        return {
-            "name": repo.name,
-            "default_branch": repo.default_branch,
-            "description": repo.description,
-            "homepage": repo.homepage,
-            "private": repo.private,
-            "archived": repo.archived,
-            "has_issues": repo.has_issues,
-            "has_projects": repo.has_projects,
-            "has_wiki": repo.has_wiki,
-            "allow_squash_merge": repo.allow_squash_merge,
-            "allow_merge_commit": repo.allow_merge_commit,
-            "allow_rebase_merge": repo.allow_rebase_merge,
-            "delete_branch_on_merge": repo.delete_branch_on_merge,
-        }
+        return dict(zip(_SETTINGS_KEYS, _get_settings(repo)))
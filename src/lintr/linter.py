@@ -1,5 +1,9 @@
 """Core linting functionality."""
 
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TextIO
 
 import colorama
 from colorama import Fore, Style
@@ -13,6 +17,10 @@ from lintr.rules.context import RuleContext
 # Initialize colorama for cross-platform color support
 colorama.init()
 
+# Default number of repositories linted concurrently. Kept small, since all workers
+# share one GitHub token and GitHub discourages many concurrent requests.
+MAX_WORKERS = 4
+
 
 class Linter:
     """Core linting functionality."""
@@ -23,6 +31,7 @@ class Linter:
         dry_run: bool = False,
         non_interactive: bool = False,
         fix: bool = False,
+        max_workers: int = MAX_WORKERS,
     ):
         """Initialize the linter.
 
@@ -31,12 +40,17 @@ class Linter:
             dry_run: If True, no changes will be made.
             non_interactive: If True, apply fixes without prompting for confirmation.
             fix: If True, attempt to fix issues automatically.
+            max_workers: Maximum number of repositories to lint concurrently.
+                Interactive fixing always lints one repository at a time.
         """
         self._config = config
         self._dry_run = dry_run
         self._non_interactive = non_interactive
         self._fix = fix
+        self._max_workers = max_workers
         self._rule_manager = RuleManager(config.rules, config.rulesets)
+        # Rule sets looked up so far, by ID. Most repositories share a few rule sets.
+        self._rule_set_cache: dict[str, RuleSet | None] = {}
 
     def create_context(self, repository: Repository) -> RuleContext:
         """Create a rule context for a repository.
@@ -68,33 +82,56 @@ class Linter:
         if repository_config:
             rule_set_id = repository_config.ruleset
             if rule_set_id:
-                rule_set = self._rule_manager.get(rule_set_id)
-                if rule_set and isinstance(rule_set, RuleSet):
+                rule_set = self._get_rule_set(rule_set_id)
+                if rule_set:
                     return rule_set_id, rule_set
 
         # Fall back to default rule set
         if self._config.default_ruleset:
-            rule_set = self._rule_manager.get(self._config.default_ruleset)
-            if rule_set and isinstance(rule_set, RuleSet):
+            rule_set = self._get_rule_set(self._config.default_ruleset)
+            if rule_set:
                 return self._config.default_ruleset, rule_set
 
         return None
 
+    def _get_rule_set(self, rule_set_id: str) -> RuleSet | None:
+        """Look up a rule set by ID, caching the result.
+
+        Args:
+            rule_set_id: ID of the rule set.
+
+        Returns:
+            The rule set if found, None otherwise.
+        """
+        try:
+            return self._rule_set_cache[rule_set_id]
+        except KeyError:
+            pass
+        rule_set = self._rule_manager.get(rule_set_id)
+        if not (rule_set and isinstance(rule_set, RuleSet)):
+            rule_set = None
+        self._rule_set_cache[rule_set_id] = rule_set
+        return rule_set
+
     def check_repository(
         self,
         repository: Repository,
         rule_set: RuleSet,
         repository_config: RepositoryConfig | None = None,
+        out: TextIO | None = None,
     ) -> dict[str, RuleCheckResult]:
         """Check a repository against all rules in a rule set.
 
         Args:
             repository: GitHub repository to check.
             rule_set: Rule set to use for checking.
+            out: Stream to write output to. Defaults to standard output.
 
         Returns:
             Dictionary mapping rule IDs to their check results.
         """
+        if out is None:
+            out = sys.stdout
         context = self.create_context(repository)
         results = {}
 
@@ -112,7 +149,8 @@ class Linter:
                 results[rule.rule_id] = result
             except Exception as e:
                 print(
-                    f"{Fore.RED}Error executing rule {rule.rule_id} on repository {repository.name}: {str(e)}{Style.RESET_ALL}"
+                    f"{Fore.RED}Error executing rule {rule.rule_id} on repository {repository.name}: {str(e)}{Style.RESET_ALL}",
+                    file=out,
                 )
                 result = RuleCheckResult(
                     result=RuleResult.FAILED,
@@ -129,17 +167,21 @@ class Linter:
             else:  # SKIPPED
                 status_symbol = f"{Fore.YELLOW}-{Style.RESET_ALL}"
 
-            print(f"  {status_symbol} {rule.rule_id}: {result.message}")
+            print(f"  {status_symbol} {rule.rule_id}: {result.message}", file=out)
 
             # Always show fix description if available
             if result.fix_available:
-                print(f"    {Fore.BLUE}⚡ {result.fix_description}{Style.RESET_ALL}")
+                print(
+                    f"    {Fore.BLUE}⚡ {result.fix_description}{Style.RESET_ALL}",
+                    file=out,
+                )
 
                 # Only proceed with fix if --fix flag is provided
                 if self._fix:
                     if self._dry_run:
                         print(
-                            f"    {Fore.YELLOW}ℹ Would attempt to fix this issue (dry run){Style.RESET_ALL}"
+                            f"    {Fore.YELLOW}ℹ Would attempt to fix this issue (dry run){Style.RESET_ALL}",
+                            file=out,
                         )
                     else:
                         try:
@@ -152,10 +194,16 @@ class Linter:
                                 should_fix = response in ["y", "yes"]
 
                             if should_fix:
-                                success, message = rule.fix(context)
+                                try:
+                                    success, message = rule.fix(context)
+                                finally:
+                                    # Even a failed fix may have changed the
+                                    # repository, so drop data cached so far
+                                    context = self.create_context(repository)
                                 if success:
                                     print(
-                                        f"    {Fore.GREEN}⚡ Fixed: {message}{Style.RESET_ALL}"
+                                        f"    {Fore.GREEN}⚡ Fixed: {message}{Style.RESET_ALL}",
+                                        file=out,
                                     )
                                     # Re-run check to get updated status
                                     result = rule.check(context)
@@ -172,19 +220,23 @@ class Linter:
                                             f"{Fore.YELLOW}-{Style.RESET_ALL}"
                                         )
                                     print(
-                                        f"  {status_symbol} {rule.rule_id}: {result.message}"
+                                        f"  {status_symbol} {rule.rule_id}: {result.message}",
+                                        file=out,
                                     )
                                 else:
                                     print(
-                                        f"    {Fore.RED}⚡ Fix failed: {message}{Style.RESET_ALL}"
+                                        f"    {Fore.RED}⚡ Fix failed: {message}{Style.RESET_ALL}",
+                                        file=out,
                                     )
                             else:
                                 print(
-                                    f"    {Fore.YELLOW}ℹ Fix skipped{Style.RESET_ALL}"
+                                    f"    {Fore.YELLOW}ℹ Fix skipped{Style.RESET_ALL}",
+                                    file=out,
                                 )
                         except Exception as e:
                             print(
-                                f"    {Fore.RED}⚡ Fix error: {str(e)}{Style.RESET_ALL}"
+                                f"    {Fore.RED}⚡ Fix error: {str(e)}{Style.RESET_ALL}",
+                                file=out,
                             )
 
         return results
@@ -194,6 +246,14 @@ class Linter:
     ) -> dict[str, dict[str, RuleCheckResult]]:
         """Lint a list of repositories.
 
+        Repositories are linted concurrently, since checks are dominated by
+        GitHub API calls. Output is buffered per repository and written in the
+        order of the given repositories. If linting a repository raises, all
+        other repositories are still linted, and fixed if non-interactive fixing
+        is enabled, and their output is written before the first exception is
+        re-raised. Interactive fixing prompts for input and therefore lints one
+        repository at a time, stopping at the first exception.
+
         Args:
             repositories: List of GitHub repositories to lint.
 
@@ -203,25 +263,64 @@ class Linter:
         """
         results = {}
 
-        for repo in repositories:
-            # Get the config for the repository.
-            repo_config = self._config.repositories.get(repo.name)
-            # Get rule set for repository
-            rule_set_info = self.get_rule_set_for_repository(repo_config)
-            if not rule_set_info:
-                print(f"{Fore.YELLOW}- {repo.name} (no rule set){Style.RESET_ALL}")
-                results[repo.name] = {"error": "No rule set found for repository"}
-                continue
+        interactive = self._fix and not self._dry_run and not self._non_interactive
+        max_workers = min(self._max_workers, len(repositories))
+        if interactive or max_workers <= 1:
+            for repo in repositories:
+                results[repo.name] = self._lint_repository(repo, sys.stdout)
+            return results
 
-            rule_set_id, rule_set = rule_set_info
-            print(f"{Fore.WHITE}- {repo.name} ({rule_set_id}){Style.RESET_ALL}")
-
-            # Run all rules in the rule set
+        def lint(repo: Repository) -> tuple[dict | None, str, Exception | None]:
+            out = io.StringIO()
             try:
-                rule_results = self.check_repository(repo, rule_set, repo_config)
-                results[repo.name] = rule_results
+                return self._lint_repository(repo, out), out.getvalue(), None
             except Exception as e:
-                print(f"{Fore.RED}  Error: {str(e)}{Style.RESET_ALL}")
-                results[repo.name] = {"error": f"Failed to check repository: {str(e)}"}
+                return None, out.getvalue(), e
+
+        error = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for repo, (result, output, e) in zip(
+                repositories, executor.map(lint, repositories)
+            ):
+                sys.stdout.write(output)
+                if e is not None:
+                    error = error or e
+                else:
+                    results[repo.name] = result
+
+        # Raise the first error only once all output has been written.
+        if error is not None:
+            raise error
 
         return results
+
+    def _lint_repository(self, repo: Repository, out: TextIO) -> dict:
+        """Lint a single repository.
+
+        Args:
+            repo: GitHub repository to lint.
+            out: Stream to write output to.
+
+        Returns:
+            Dictionary mapping rule IDs to their check results, or a dictionary
+            with an error message if the repository could not be checked.
+        """
+        # Get the config for the repository.
+        repo_config = self._config.repositories.get(repo.name)
+        # Get rule set for repository
+        rule_set_info = self.get_rule_set_for_repository(repo_config)
+        if not rule_set_info:
+            print(
+                f"{Fore.YELLOW}- {repo.name} (no rule set){Style.RESET_ALL}", file=out
+            )
+            return {"error": "No rule set found for repository"}
+
+        rule_set_id, rule_set = rule_set_info
+        print(f"{Fore.WHITE}- {repo.name} ({rule_set_id}){Style.RESET_ALL}", file=out)
+
+        # Run all rules in the rule set
+        try:
+            return self.check_repository(repo, rule_set, repo_config, out=out)
+        except Exception as e:
+            print(f"{Fore.RED}  Error: {str(e)}{Style.RESET_ALL}", file=out)
+            return {"error": f"Failed to check repository: {str(e)}"}
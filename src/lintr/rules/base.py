@@ -215,7 +215,7 @@ class RuleResult(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleCheckResult:
     """Result of a rule check with details."""
 
@@ -294,6 +294,10 @@ _generic_base = Rule
 class RuleSet:
     """A collection of rules that can be applied together."""
 
+    # Incremented whenever any rule set is modified. Cached rule lists computed at
+    # an older generation are stale, which also covers changes to nested rule sets.
+    _generation = 0
+
     def __init__(self, id: str, description: str):
         """Initialize a rule set.
 
@@ -306,6 +310,8 @@ class RuleSet:
         # Store both rules and rule sets in a single list, maintaining order
         self._items: list[Union[type[Rule], "RuleSet"]] = []
         self._mutually_exclusive = dict()
+        # Generation and result of the last rules() computation.
+        self._rules_cache: tuple[int, tuple[type[Rule], ...]] | None = None
 
     @property
     def id(self) -> str:
@@ -329,6 +335,7 @@ class RuleSet:
             raise ValueError(f"Rule {rule.rule_id} is abstract.")
 
         self._items.append(rule)
+        RuleSet._generation += 1
 
     def rules(self) -> Iterator[type[Rule]]:
         """Get all rules in this rule set, including those from nested rule sets.
@@ -339,6 +346,11 @@ class RuleSet:
         Yields:
             Rules in this rule set and all nested rule sets in order of addition.
         """
+        generation = RuleSet._generation
+        if self._rules_cache is not None and self._rules_cache[0] == generation:
+            yield from self._rules_cache[1]
+            return
+
         rules = []
         for item in self._items:
             if isinstance(item, RuleSet):
@@ -353,7 +365,8 @@ class RuleSet:
                     seen.add(rule.rule_id)
                     yield rule
 
-        rules = reversed(list(remove_dupes(rules)))
+        rules = tuple(reversed(list(remove_dupes(rules))))
+        self._rules_cache = (generation, rules)
 
         yield from rules
 
@@ -1,7 +1,10 @@
 """Context object for rule execution."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
+from github.Branch import Branch
+from github.NamedUser import NamedUser
 from github.Repository import Repository
 
 
@@ -13,7 +16,20 @@ class RuleContext:
     Currently, it contains:
     - repository: The GitHub repository object
     - dry_run: Whether to make actual changes or just simulate them
+
+    Data needed by several rules is fetched on first use and shared between
+    them. A new context must be created to observe changes made by fixes.
     """
 
     repository: Repository
     dry_run: bool = False
+
+    @cached_property
+    def branches(self) -> list[Branch]:
+        """Branches of the repository."""
+        return list(self.repository.get_branches())
+
+    @cached_property
+    def collaborators(self) -> list[NamedUser]:
+        """Collaborators of the repository."""
+        return list(self.repository.get_collaborators())
@@ -38,7 +38,7 @@ class GitFlowBranchNamingRule(Rule):
         """
         try:
             # Get all branches
-            branches = list(context.repository.get_branches())
+            branches = context.branches
             branch_names = [b.name for b in branches]
 
             # Check for main/master branch
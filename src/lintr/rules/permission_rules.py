@@ -36,7 +36,7 @@ class SingleOwnerRule(Rule):
         """
         try:
             # Get all collaborators with their permissions
-            collaborators = context.repository.get_collaborators()
+            collaborators = context.collaborators
 
             # Get the authenticated user's login
             authenticated_user = context.repository.owner.login
@@ -100,7 +100,7 @@ class NoCollaboratorsRule(Rule):
         """
         try:
             # Get all collaborators
-            collaborators = context.repository.get_collaborators()
+            collaborators = context.collaborators
 
             # Get the authenticated user's login
             authenticated_user = context.repository.owner.login
@@ -184,7 +184,7 @@ class NoClassicBranchProtectionRule(Rule):
         """
         try:
             # Get all branches
-            branches = context.repository.get_branches()
+            branches = context.branches
 
             # Check each branch for classic branch protection
             protected_branches = []
@@ -1,15 +1,16 @@
 """Test configuration and fixtures."""
 
+import json
 import os
-import tempfile
 from collections.abc import Callable
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, TextIO
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-import yaml
 from _pytest.monkeypatch import MonkeyPatch
 
 from lintr.rules.base import Rule, RuleResult, RuleCheckResult, RuleContext
@@ -56,51 +57,82 @@ def env(monkeypatch: MonkeyPatch) -> None:
 
 
 @pytest.fixture
-def env_file() -> Generator[Path, None, None]:
+def env_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
     """Create a temporary .env file.
 
-    Creates a .env file in the current working directory (which will be a temporary
-    directory thanks to the temp_working_dir fixture) with test values for verifying
-    configuration loading from .env files.
+    Creates a .env file in a per-test temporary directory and makes that directory
+    the current working directory, so configuration loading picks it up without
+    touching the project root. This keeps the fixture safe to use when tests run
+    in parallel with pytest-xdist.
 
-    The file is automatically cleaned up after the test completes.
+    The directory is cleaned up by pytest and the working directory is restored
+    by monkeypatch after the test completes.
 
     Returns:
         Path to the .env file
     """
-    env_file = Path(".env")
+    monkeypatch.chdir(tmp_path)
+    env_file = tmp_path / ".env"
     env_file.write_text(
         "LINTR_GITHUB_TOKEN=env-file-token\n" "LINTR_DEFAULT_RULESET=env-file-ruleset\n"
     )
-    yield env_file
-    env_file.unlink()
+    return env_file
 
 
 class TestConfigFile:
-    def __init__(self, f: TextIO):
-        self._f = f
+    """A configuration file whose content can be replaced by a test.
+
+    Files are never rewritten in place. Instead, each call to `set` points the
+    instance at a file holding the requested content, which is written at most
+    once per test session.
+    """
+
+    def __init__(self, write: Callable[[dict | str], Path], content: dict | str):
+        self._write = write
+        self._path = write(content)
 
     @property
     def path(self) -> Path:
-        return Path(self._f.name)
+        return self._path
 
     def set(self, content: dict | str) -> None:
-        self._f.seek(0)  # Go to beginning of file
-        if isinstance(content, dict):
-            yaml.dump(content, self._f)
+        self._path = self._write(content)
+
+
+@pytest.fixture(scope="session")
+def config_file_writer(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[dict | str], Path]:
+    """Return a function that writes configuration files, once per distinct content.
+
+    Configuration files written by the returned function are shared between tests
+    and must be treated as read-only.
+    """
+    directory = tmp_path_factory.mktemp("config")
+    paths: dict[str, Path] = {}
+
+    def write(content: dict | str) -> Path:
+        # JSON is valid YAML and much cheaper to produce than yaml.dump output.
+        if isinstance(content, str):
+            key = content
         else:
-            self._f.write(content)
-        self._f.truncate()  # Remove any remaining content
-        self._f.flush()  # Ensure content is written to disk
+            key = json.dumps(content, sort_keys=True)
+        path = paths.get(key)
+        if path is None:
+            path = directory / f"config-{len(paths)}.yml"
+            path.write_text(key)
+            paths[key] = path
+        return path
+
+    return write
 
 
 @pytest.fixture
-def config_file() -> Generator[TestConfigFile, None, None]:
+def config_file(config_file_writer: Callable[[dict | str], Path]) -> TestConfigFile:
     """Create a temporary configuration file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        c = TestConfigFile(f)
-        c.set(
-            """
+    return TestConfigFile(
+        config_file_writer,
+        """
 github_token: yaml-token
 default_ruleset: basic
 repository_filter:
@@ -118,23 +150,22 @@ rulesets:
     description: basic
     rules:
       - "G001P"
-"""
-        )
-        yield c
-    os.unlink(f.name)
+""",
+    )
 
 
 @pytest.fixture
 def config(monkeypatch: MonkeyPatch) -> Generator[Any, None, None]:
     """Create a mocked configuration object with pre-defined properties."""
-    # Create a mock config instance with pre-defined properties
-    mock_config = MagicMock()
-    mock_config.github_token = "token"
-    mock_config.default_ruleset = "empty"
-    mock_config.repository_filter = None
-    mock_config.rulesets = {}
-    mock_config.repositories = {}
-    mock_config.rules = {}
+    # Create a plain config stand-in with pre-defined properties
+    mock_config = SimpleNamespace(
+        github_token="token",
+        default_ruleset="empty",
+        repository_filter=None,
+        rulesets={},
+        repositories={},
+        rules={},
+    )
 
     # Create a mock config class that returns our pre-defined config
     mock_config_class = MagicMock()
@@ -168,31 +199,41 @@ def repository():
     return repo
 
 
-@pytest.fixture
-def mock_github(monkeypatch):
-    """Mock GitHub API responses."""
+@dataclass(slots=True, frozen=True)
+class MockRepository:
+    """Minimal stand-in for a GitHub repository."""
+
+    name: str
+    private: bool = False
+    archived: bool = False
+
+
+# Repositories returned by MockGitHubClient, shared across tests. A tuple, so that
+# no test can change the repositories seen by the others.
+_MOCK_REPOSITORIES = (
+    MockRepository("test-repo-1", private=False, archived=False),
+    MockRepository("test-repo-2", private=True, archived=True),
+)
+
 
-    class MockRepository:
-        def __init__(self, name, private=False, archived=False):
-            self.name = name
-            self.private = private
-            self.archived = archived
+class MockGitHubClient:
+    """Stand-in for GitHubClient that returns a fixed list of repositories."""
 
-    class MockGitHubClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    def __init__(self, *args, **kwargs):
+        pass
 
-        def get_repositories(self):
-            return [
-                MockRepository("test-repo-1", private=False, archived=False),
-                MockRepository("test-repo-2", private=True, archived=True),
-            ]
+    def get_repositories(self):
+        return list(_MOCK_REPOSITORIES)
 
+
+@pytest.fixture
+def mock_github(monkeypatch):
+    """Mock GitHub API responses."""
     monkeypatch.setattr("lintr.gh.GitHubClient", MockGitHubClient)
     return MockGitHubClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rule_cls() -> (
     Callable[
         [
@@ -248,7 +289,7 @@ def rule_cls() -> (
 def rule_manager():
     """Create a mock rule manager."""
     with patch("lintr.linter.RuleManager") as mock_manager_class:
-        # Setup mock rule manager
-        mock_manager = MagicMock()
+        # Setup mock rule manager; the linter only looks up rule sets
+        mock_manager = Mock(spec_set=["get"])
         mock_manager_class.return_value = mock_manager
         yield mock_manager
@@ -1,5 +1,7 @@
 """Tests for permission rules."""
 
+import re
+
 import pytest
 from github.GithubException import GithubException
 from unittest.mock import MagicMock, PropertyMock
@@ -20,6 +22,18 @@ from lintr.rules.general import (
     RebaseMergeDisabledRule,
 )
 
+# Rule types the develop branch ruleset fix is expected to configure.
+_EXPECTED_DEVELOP_RULE_TYPES = frozenset(
+    {
+        "creation",
+        "update",
+        "deletion",
+        "required_signatures",
+        "pull_request",
+        "non_fast_forward",
+    }
+)
+
 
 def test_single_owner_rule_pass():
     """Test SingleOwnerRule passes when user is the only admin."""
@@ -1009,10 +1023,13 @@ def test_develop_branch_ruleset_rule_fail_additional_rules(repository):
 
     # Verify result
     assert result.result == RuleResult.FAILED
-    assert (
-        "Additional rules found that are not allowed: required_deployments, required_linear_history"
-        in result.message
-    )
+    match = re.search(r"not allowed: (.+?)(?:\n|$)", result.message)
+    assert match is not None
+    assert set(match.group(1).split(", ")) == {
+        "required_deployments",
+        "required_linear_history",
+        "required_pull_request",  # Not one of the expected rule types either
+    }
     assert result.fix_available
     assert "Update ruleset 'develop protection'." == result.fix_description
 
@@ -1145,25 +1162,18 @@ def test_develop_branch_ruleset_rule_fix_create(repository):
 
     # Verify that create_ruleset was called with correct arguments
     repository.create_ruleset.assert_called_once()
-    call_args = repository.create_ruleset.call_args[1]
-    assert call_args["name"] == "develop protection"
-    assert call_args["target"] == "branch"
-    assert call_args["enforcement"] == "active"
-    assert call_args["conditions"]["ref_name"]["include"] == ["refs/heads/develop"]
-    assert call_args["conditions"]["ref_name"]["exclude"] == []
+    kwargs = repository.create_ruleset.call_args.kwargs
+    assert kwargs["name"] == "develop protection"
+    assert kwargs["target"] == "branch"
+    assert kwargs["enforcement"] == "active"
+    assert kwargs["conditions"]["ref_name"]["include"] == ["refs/heads/develop"]
+    assert kwargs["conditions"]["ref_name"]["exclude"] == []
 
     # Check rules
-    rules = call_args["rules"]
+    rules = kwargs["rules"]
     assert len(rules) == 6
-    rule_types = {rule["type"] for rule in rules}
-    assert rule_types == {
-        "creation",
-        "update",
-        "deletion",
-        "required_signatures",
-        "pull_request",
-        "non_fast_forward",
-    }
+    rule_types = frozenset(rule["type"] for rule in rules)
+    assert rule_types == _EXPECTED_DEVELOP_RULE_TYPES
 
 
 def test_develop_branch_ruleset_rule_fix_update(repository):
@@ -1186,25 +1196,18 @@ def test_develop_branch_ruleset_rule_fix_update(repository):
 
     # Verify that update was called with correct arguments
     mock_ruleset.update.assert_called_once()
-    call_args = mock_ruleset.update.call_args[1]
-    assert call_args["name"] == "develop protection"
-    assert call_args["target"] == "branch"
-    assert call_args["enforcement"] == "active"
-    assert call_args["conditions"]["ref_name"]["include"] == ["refs/heads/develop"]
-    assert call_args["conditions"]["ref_name"]["exclude"] == []
+    kwargs = mock_ruleset.update.call_args.kwargs
+    assert kwargs["name"] == "develop protection"
+    assert kwargs["target"] == "branch"
+    assert kwargs["enforcement"] == "active"
+    assert kwargs["conditions"]["ref_name"]["include"] == ["refs/heads/develop"]
+    assert kwargs["conditions"]["ref_name"]["exclude"] == []
 
     # Check rules
-    rules = call_args["rules"]
+    rules = kwargs["rules"]
     assert len(rules) == 6
-    rule_types = {rule["type"] for rule in rules}
-    assert rule_types == {
-        "creation",
-        "update",
-        "deletion",
-        "required_signatures",
-        "pull_request",
-        "non_fast_forward",
-    }
+    rule_types = frozenset(rule["type"] for rule in rules)
+    assert rule_types == _EXPECTED_DEVELOP_RULE_TYPES
 
 
 def test_develop_branch_ruleset_rule_fix_error(repository):
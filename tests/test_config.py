@@ -1,6 +1,5 @@
 """Tests for configuration handling."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -21,6 +20,20 @@ def test_repository_filter_defaults():
     assert filter_config.exclude_patterns == []
 
 
+def test_repository_filter_matches():
+    """Test matching repository names against filter patterns."""
+    assert RepositoryFilter().matches("any-repo")
+
+    filter_config = RepositoryFilter(
+        include_patterns=["test-*", "demo-?"], exclude_patterns=["*-api"]
+    )
+    assert filter_config.matches("test-repo")
+    assert filter_config.matches("demo-1")
+    assert not filter_config.matches("demo-app")
+    assert not filter_config.matches("test-api")
+    assert not filter_config.matches("other")
+
+
 def test_rule_set_config_validation():
     """Test validation of RuleSetConfig."""
     # Test required fields
@@ -69,15 +82,92 @@ def test_missing_config_file():
         create_config_class(yaml_file=Path("nonexistent.yaml"))
 
 
-def test_invalid_config_file(monkeypatch):
+def test_yaml_content():
+    """Test loading configuration from a YAML string."""
+    LintrConfig = create_config_class(
+        yaml_content="github_token: yaml-token\ndefault_ruleset: basic\n"
+    )
+    config = LintrConfig()
+
+    assert config.github_token == "yaml-token"
+    assert config.default_ruleset == "basic"
+
+
+def test_invalid_config_file(config_file_writer):
     """Test handling of invalid YAML configuration."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml") as f:
-        f.write("invalid: yaml: file:")  # Invalid YAML
-        f.flush()
+    path = config_file_writer("invalid: yaml: file:")  # Invalid YAML
 
-        with pytest.raises(ValidationError):
-            LintrConfig = create_config_class(yaml_file=Path(f.name))
-            LintrConfig()
+    with pytest.raises(ValidationError):
+        LintrConfig = create_config_class(yaml_file=path)
+        LintrConfig()
+
+
+def test_invalid_yaml_content():
+    """Test handling of invalid YAML configuration given as a string."""
+    with pytest.raises(ValidationError):
+        LintrConfig = create_config_class(yaml_content="invalid: yaml: file:")
+        LintrConfig()
+
+
+def test_config_class_is_cached(tmp_path):
+    """Test that config classes are reused until the YAML file changes."""
+    path = tmp_path / "config.yml"
+    path.write_text("github_token: yaml-token\n")
+
+    LintrConfig = create_config_class(yaml_file=path)
+    assert create_config_class(yaml_file=path) is LintrConfig
+    assert LintrConfig().github_token == "yaml-token"
+    assert LintrConfig().github_token == "yaml-token"
+
+    path.write_text("github_token: other-token\n")
+
+    UpdatedConfig = create_config_class(yaml_file=path)
+    assert UpdatedConfig is not LintrConfig
+    assert UpdatedConfig().github_token == "other-token"
+
+
+def test_config_instances_do_not_share_yaml_data(config_file_writer):
+    """Test that mutating one config instance does not affect later ones."""
+    path = config_file_writer(
+        {
+            "github_token": "yaml-token",
+            "rules": {
+                "r1": {
+                    "base": "G001",
+                    "description": "Custom rule",
+                    "config": {"nested": {"a": 1}},
+                }
+            },
+        }
+    )
+
+    LintrConfig = create_config_class(yaml_file=path)
+    config = LintrConfig()
+    config.rules["r1"].config["nested"]["a"] = 99
+
+    assert LintrConfig().rules["r1"].config == {"nested": {"a": 1}}
+    assert create_config_class(yaml_file=path)().rules["r1"].config == {
+        "nested": {"a": 1}
+    }
+
+
+def test_yaml_content_instances_do_not_share_data():
+    """Test that config classes for YAML content copy their data per instance."""
+    content = """
+github_token: yaml-token
+rules:
+  r1:
+    base: G001
+    description: Custom rule
+    config:
+      nested: {a: 1}
+"""
+
+    LintrConfig = create_config_class(yaml_content=content)
+    assert create_config_class(yaml_content=content) is LintrConfig
+    LintrConfig().rules["r1"].config["nested"]["a"] = 99
+
+    assert LintrConfig().rules["r1"].config == {"nested": {"a": 1}}
 
 
 def test_missing_required_fields():
@@ -1,7 +1,10 @@
 """Tests for GitHub API integration."""
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import MagicMock, patch
+from github import Auth
 
 from lintr.gh import GitHubClient, GitHubConfig
 
@@ -12,6 +15,30 @@ def github_config():
     return GitHubConfig(token="test-token")
 
 
+@pytest.fixture
+def repository():
+    """Create a plain stand-in for a GitHub repository.
+
+    The GitHub client only reads attributes of repositories, so a namespace is
+    sufficient here and cheaper to access than a MagicMock.
+    """
+    return SimpleNamespace(
+        name="test-repo",
+        default_branch="main",
+        description="Test repository",
+        homepage="https://example.com",
+        private=False,
+        archived=False,
+        has_issues=True,
+        has_projects=True,
+        has_wiki=True,
+        allow_squash_merge=True,
+        allow_merge_commit=True,
+        allow_rebase_merge=True,
+        delete_branch_on_merge=True,
+    )
+
+
 def test_github_config_validation():
     """Test GitHub configuration validation."""
     config = GitHubConfig(token="test-token")
@@ -21,74 +48,78 @@ def test_github_config_validation():
     assert config.include_archived is False
 
 
-def test_get_user_repositories(github_config, repository):
+def test_get_user_repositories(mocker, github_config, repository):
     """Test getting user repositories."""
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup mock
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository]
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
-
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
-
-        assert len(repos) == 1
-        assert repos[0].name == "test-repo"
-        mock_user.get_repos.assert_called_once_with(affiliation="owner")
-        mock_github_class.assert_called_once()
-
-
-def test_get_org_repositories(repository):
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup mock
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository]
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
+
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
+
+    assert len(repos) == 1
+    assert repos[0].name == "test-repo"
+    mock_user.get_repos.assert_called_once_with(affiliation="owner")
+    mock_github_class.assert_called_once()
+    kwargs = mock_github_class.call_args.kwargs
+    assert isinstance(kwargs["auth"], Auth.Token)
+    assert kwargs["auth"].token == github_config.token
+    assert kwargs["per_page"] == 100
+
+
+def test_get_org_repositories(mocker, repository):
     """Test getting organization repositories."""
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup config with org
-        config = GitHubConfig(token="test-token", org_name="test-org")
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup config with org
+    config = GitHubConfig(token="test-token", org_name="test-org")
 
-        # Setup mock
-        mock_org = MagicMock()
-        mock_org.get_repos.return_value = [repository]
-        mock_github = MagicMock()
-        mock_github.get_organization.return_value = mock_org
-        mock_github_class.return_value = mock_github
+    # Setup mock
+    mock_org = MagicMock()
+    mock_org.get_repos.return_value = [repository]
+    mock_github = MagicMock()
+    mock_github.get_organization.return_value = mock_org
+    mock_github_class.return_value = mock_github
 
-        client = GitHubClient(config)
-        repos = client.get_repositories()
+    client = GitHubClient(config)
+    repos = client.get_repositories()
 
-        assert len(repos) == 1
-        assert repos[0].name == "test-repo"
-        mock_github.get_organization.assert_called_once_with("test-org")
-        mock_org.get_repos.assert_called_once()
-        mock_github_class.assert_called_once()
+    assert len(repos) == 1
+    assert repos[0].name == "test-repo"
+    mock_github.get_organization.assert_called_once_with("test-org")
+    mock_org.get_repos.assert_called_once()
+    mock_github_class.assert_called_once()
 
 
-def test_get_repository_settings(github_config, repository):
+def test_get_repository_settings(mocker, github_config, repository):
     """Test getting repository settings."""
-    with patch("lintr.gh.Github") as mock_github_class:
-        mock_github = MagicMock()
-        mock_github_class.return_value = mock_github
-
-        client = GitHubClient(github_config)
-        settings = client.get_repository_settings(repository)
-
-        assert settings["name"] == "test-repo"
-        assert settings["default_branch"] == "main"
-        assert settings["description"] == "Test repository"
-        assert settings["homepage"] == "https://example.com"
-        assert settings["private"] is False
-        assert settings["archived"] is False
-        assert settings["has_issues"] is True
-        assert settings["has_projects"] is True
-        assert settings["has_wiki"] is True
-        assert settings["allow_squash_merge"] is True
-        assert settings["allow_merge_commit"] is True
-        assert settings["allow_rebase_merge"] is True
-        assert settings["delete_branch_on_merge"] is True
-        mock_github_class.assert_called_once()
-
-
-def test_repository_filtering_with_include_patterns(github_config, repository):
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    mock_github = MagicMock()
+    mock_github_class.return_value = mock_github
+
+    client = GitHubClient(github_config)
+    settings = client.get_repository_settings(repository)
+
+    assert settings["name"] == "test-repo"
+    assert settings["default_branch"] == "main"
+    assert settings["description"] == "Test repository"
+    assert settings["homepage"] == "https://example.com"
+    assert settings["private"] is False
+    assert settings["archived"] is False
+    assert settings["has_issues"] is True
+    assert settings["has_projects"] is True
+    assert settings["has_wiki"] is True
+    assert settings["allow_squash_merge"] is True
+    assert settings["allow_merge_commit"] is True
+    assert settings["allow_rebase_merge"] is True
+    assert settings["delete_branch_on_merge"] is True
+    mock_github_class.assert_called_once()
+
+
+def test_repository_filtering_with_include_patterns(mocker, github_config, repository):
     """Test repository filtering with include patterns."""
     # Create additional mock repos
     mock_repo2 = MagicMock()
@@ -104,27 +135,27 @@ def test_repository_filtering_with_include_patterns(github_config, repository):
     # Set up include patterns to match only test-* repositories
     github_config.repository_filter.include_patterns = ["test-*"]
 
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup mock
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup mock
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
 
-        # Create client and get repositories
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
+    # Create client and get repositories
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
 
-        # Verify only repositories matching the pattern are returned
-        assert len(repos) == 2
-        repo_names = [repo.name for repo in repos]
-        assert "test-repo" in repo_names
-        assert "test-api" in repo_names
-        assert "demo-app" not in repo_names
+    # Verify only repositories matching the pattern are returned
+    assert len(repos) == 2
+    repo_names = [repo.name for repo in repos]
+    assert "test-repo" in repo_names
+    assert "test-api" in repo_names
+    assert "demo-app" not in repo_names
 
 
-def test_repository_filtering_with_exclude_patterns(github_config, repository):
+def test_repository_filtering_with_exclude_patterns(mocker, github_config, repository):
     """Test repository filtering with exclude patterns."""
     # Create additional mock repos
     mock_repo2 = MagicMock()
@@ -140,24 +171,24 @@ def test_repository_filtering_with_exclude_patterns(github_config, repository):
     # Set up exclude patterns to exclude test-* repositories
     github_config.repository_filter.exclude_patterns = ["test-*"]
 
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup mock
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup mock
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
 
-        # Create client and get repositories
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
+    # Create client and get repositories
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
 
-        # Verify only non-excluded repositories are returned
-        assert len(repos) == 1
-        assert repos[0].name == "demo-app"
+    # Verify only non-excluded repositories are returned
+    assert len(repos) == 1
+    assert repos[0].name == "demo-app"
 
 
-def test_repository_filtering_with_both_patterns(github_config, repository):
+def test_repository_filtering_with_both_patterns(mocker, github_config, repository):
     """Test repository filtering with both include and exclude patterns."""
     # Create additional mock repos
     mock_repo2 = MagicMock()
@@ -179,33 +210,33 @@ def test_repository_filtering_with_both_patterns(github_config, repository):
     github_config.repository_filter.include_patterns = ["test-*"]
     github_config.repository_filter.exclude_patterns = ["*-api"]
 
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup mock
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [
-            repository,
-            mock_repo2,
-            mock_repo3,
-            mock_repo4,
-        ]
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
-
-        # Create client and get repositories
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
-
-        # Verify only repositories matching include but not exclude are returned
-        assert len(repos) == 2
-        repo_names = [repo.name for repo in repos]
-        assert "test-repo" in repo_names
-        assert "test-demo" in repo_names
-        assert "test-api" not in repo_names
-        assert "demo-app" not in repo_names
-
-
-def test_repository_filtering_with_empty_patterns(github_config, repository):
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup mock
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [
+        repository,
+        mock_repo2,
+        mock_repo3,
+        mock_repo4,
+    ]
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
+
+    # Create client and get repositories
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
+
+    # Verify only repositories matching include but not exclude are returned
+    assert len(repos) == 2
+    repo_names = [repo.name for repo in repos]
+    assert "test-repo" in repo_names
+    assert "test-demo" in repo_names
+    assert "test-api" not in repo_names
+    assert "demo-app" not in repo_names
+
+
+def test_repository_filtering_with_empty_patterns(mocker, github_config, repository):
     """Test that empty pattern lists don't affect filtering."""
     # Create additional mock repos
     mock_repo2 = MagicMock()
@@ -222,65 +253,65 @@ def test_repository_filtering_with_empty_patterns(github_config, repository):
     github_config.repository_filter.include_patterns = []
     github_config.repository_filter.exclude_patterns = []
 
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Setup mock
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Setup mock
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository, mock_repo2, mock_repo3]
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
 
-        # Create client and get repositories
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
+    # Create client and get repositories
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
 
-        # Verify all repositories are returned when patterns are empty
-        assert len(repos) == 3
-        repo_names = [repo.name for repo in repos]
-        assert "test-repo" in repo_names
-        assert "test-api" in repo_names
-        assert "demo-app" in repo_names
+    # Verify all repositories are returned when patterns are empty
+    assert len(repos) == 3
+    repo_names = [repo.name for repo in repos]
+    assert "test-repo" in repo_names
+    assert "test-api" in repo_names
+    assert "demo-app" in repo_names
 
 
-def test_include_organisation_repositories(github_config, repository):
+def test_include_organisation_repositories(mocker, github_config, repository):
     """Test including organisation repositories."""
-    with patch("lintr.gh.Github") as mock_github_class:
-        # Test with include_organisations=True
-        mock_org = MagicMock()
-        mock_org.get_repos.return_value = [repository]
-
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository]
-        mock_user.get_orgs.return_value = [mock_org]
-
-        mock_github = MagicMock()
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
-
-        github_config.include_organisations = True
-        client = GitHubClient(github_config)
-        repos = client.get_repositories()
-
-        # Should get both user and org repos
-        assert len(repos) == 2
-        mock_user.get_repos.assert_called_once_with(affiliation="owner")
-        mock_user.get_orgs.assert_called_once()
-        mock_org.get_repos.assert_called_once()
-
-        # Reset mocks for next test
-        mock_github_class.reset_mock()
-        mock_github = MagicMock()
-        mock_user = MagicMock()
-        mock_user.get_repos.return_value = [repository]
-        mock_github.get_user.return_value = mock_user
-        mock_github_class.return_value = mock_github
-
-        # Test with include_organisations=False
-        config = GitHubConfig(token="test-token", include_organisations=False)
-        client = GitHubClient(config)
-        repos = client.get_repositories()
-
-        # Should only get user repos
-        assert len(repos) == 1
-        mock_user.get_repos.assert_called_once_with(affiliation="owner")
-        mock_user.get_orgs.assert_not_called()
+    mock_github_class = mocker.patch("lintr.gh.Github")
+    # Test with include_organisations=True
+    mock_org = MagicMock()
+    mock_org.get_repos.return_value = [repository]
+
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository]
+    mock_user.get_orgs.return_value = [mock_org]
+
+    mock_github = MagicMock()
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
+
+    github_config.include_organisations = True
+    client = GitHubClient(github_config)
+    repos = client.get_repositories()
+
+    # Should get both user and org repos
+    assert len(repos) == 2
+    mock_user.get_repos.assert_called_once_with(affiliation="owner")
+    mock_user.get_orgs.assert_called_once()
+    mock_org.get_repos.assert_called_once()
+
+    # Reset mocks for next test
+    mock_github_class.reset_mock()
+    mock_github = MagicMock()
+    mock_user = MagicMock()
+    mock_user.get_repos.return_value = [repository]
+    mock_github.get_user.return_value = mock_user
+    mock_github_class.return_value = mock_github
+
+    # Test with include_organisations=False
+    config = GitHubConfig(token="test-token", include_organisations=False)
+    client = GitHubClient(config)
+    repos = client.get_repositories()
+
+    # Should only get user repos
+    assert len(repos) == 1
+    mock_user.get_repos.assert_called_once_with(affiliation="owner")
+    mock_user.get_orgs.assert_not_called()
@@ -1,28 +1,22 @@
 """Tests for core linting functionality."""
-from abc import ABC
-from unittest.mock import MagicMock, patch
+import re
+from dataclasses import dataclass
+from unittest.mock import MagicMock
 
 import pytest
-from colorama import Fore, Style
 
 from lintr.config import RepositoryConfig
 from lintr.linter import Linter
-from lintr.rules import Rule, RuleCheckResult, RuleResult, RuleSet
+from lintr.rules import RuleCheckResult, RuleResult, RuleSet
 from lintr.rules.base import RuleContext
 
 
+_RX_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
 def strip_color_codes(text: str) -> str:
     """Strip ANSI color codes from text."""
-    for color in [
-        Fore.GREEN,
-        Fore.RED,
-        Fore.YELLOW,
-        Fore.BLUE,
-        Fore.WHITE,
-        Style.RESET_ALL,
-    ]:
-        text = text.replace(str(color), "")
-    return text
+    return _RX_ANSI.sub("", text)
 
 
 class CustomException(Exception):
@@ -33,6 +27,34 @@ class CustomException(Exception):
         super().__init__(self.message)
 
 
+# Result of a failed check that can be fixed.
+_FIXABLE_RESULT = RuleCheckResult(
+    result=RuleResult.FAILED,
+    message="Rule failed but can be fixed",
+    fix_available=True,
+    fix_description="This can be fixed automatically",
+)
+
+
+@dataclass(slots=True)
+class _Repo:
+    """Plain stand-in for a GitHub repository; the linter only reads attributes."""
+
+    name: str = "test-repo"
+    default_branch: str = "main"
+    description: str = "Test repository"
+    homepage: str = "https://example.com"
+    private: bool = False
+    archived: bool = False
+    empty: bool = False
+
+
+@pytest.fixture
+def repository():
+    """Create a mock GitHub repository."""
+    return _Repo()
+
+
 @pytest.fixture
 def ruleset(rule_cls):
     """Create a mock rule set."""
@@ -83,6 +105,20 @@ def test_rule_set_rules_uniqueness(rule_cls):
     assert rules[2].description == "Third rule - grandchild"
 
 
+def test_rule_set_rules_after_nested_change(rule_cls):
+    """Test that rules reflect changes to nested rule sets made after a lookup."""
+    parent = RuleSet("parent", "Parent rule set")
+    child = RuleSet("child", "Child rule set")
+    parent.add(rule_cls("G001", "First rule"))
+    parent.add(child)
+
+    assert [r.rule_id for r in parent.rules()] == ["G001"]
+
+    child.add(rule_cls("G002", "Second rule"))
+
+    assert [r.rule_id for r in parent.rules()] == ["G001", "G002"]
+
+
 def test_create_context(repository, config):
     """Test creating a rule context."""
     linter = Linter(config)
@@ -92,58 +128,59 @@ def test_create_context(repository, config):
     assert not context.dry_run
 
 
-def test_get_rule_set_for_repository_default(repository, config, ruleset, rule_manager):
-    """Test getting default rule set for repository."""
-    # Setup mock rule manager
-    rule_manager.get.return_value = ruleset
+def test_context_fetches_shared_data_once():
+    """Test that branches and collaborators are fetched once per context."""
+    repository = MagicMock()
+    repository.get_branches.return_value = iter([MagicMock()])
+    repository.get_collaborators.return_value = iter([MagicMock()])
+    context = RuleContext(repository)
 
-    # Create linter and get rule set
-    linter = Linter(config)
-    rule_set_info = linter.get_rule_set_for_repository(None)
+    assert context.branches is context.branches
+    assert len(context.branches) == 1
+    assert len(context.collaborators) == 1
+    repository.get_branches.assert_called_once()
+    repository.get_collaborators.assert_called_once()
 
-    # Verify correct rule set is returned
-    assert rule_set_info is not None
-    rule_set_id, rule_set = rule_set_info
-    assert rule_set_id == "empty"
-    assert rule_set == ruleset
-    rule_manager.get.assert_called_once_with("empty")
 
-
-def test_get_rule_set_for_repository_specific(
-    repository, config, ruleset, rule_manager
+@pytest.mark.parametrize(
+    "repository_config,found,expected_id",
+    [
+        (None, True, "empty"),
+        (RepositoryConfig(ruleset="specific"), True, "specific"),
+        (None, False, "empty"),
+    ],
+    ids=["default", "specific", "not_found"],
+)
+def test_get_rule_set_for_repository(
+    config, ruleset, rule_manager, repository_config, found, expected_id
 ):
-    """Test getting repository-specific rule set."""
-    # Configure repository-specific rule set
-    ruleset._id = "specific"
-
+    """Test getting the rule set for a repository."""
     # Setup mock rule manager
-    rule_manager.get.return_value = ruleset
+    rule_manager.get.return_value = ruleset if found else None
 
     # Create linter and get rule set
     linter = Linter(config)
-    rule_set_info = linter.get_rule_set_for_repository(
-        RepositoryConfig(ruleset="specific")
-    )
+    rule_set_info = linter.get_rule_set_for_repository(repository_config)
 
     # Verify correct rule set is returned
-    assert rule_set_info is not None
-    rule_set_id, rule_set = rule_set_info
-    assert rule_set_id == "specific"
-    assert rule_set == ruleset
-    rule_manager.get.assert_called_once_with("specific")
+    if found:
+        assert rule_set_info == (expected_id, ruleset)
+    else:
+        assert rule_set_info is None
+    rule_manager.get.assert_called_once_with(expected_id)
 
 
-def test_get_rule_set_for_repository_not_found(repository, config, rule_manager):
-    """Test handling of non-existent rule set."""
-    # Setup mock rule manager to return no rule set
-    rule_manager.get.return_value = None
+def test_get_rule_set_for_repository_cached(config, ruleset, rule_manager):
+    """Test that rule sets are looked up once per linter."""
+    # Setup mock rule manager
+    rule_manager.get.return_value = ruleset
 
-    # Create linter and get rule set
+    # Resolve the default rule set for several repositories
     linter = Linter(config)
-    rule_set_info = linter.get_rule_set_for_repository(None)
+    for _ in range(3):
+        assert linter.get_rule_set_for_repository(None) == ("empty", ruleset)
 
-    # Verify no rule set is returned
-    assert rule_set_info is None
+    # Verify the rule manager is only queried once
     rule_manager.get.assert_called_once_with("empty")
 
 
@@ -176,13 +213,16 @@ def test_check_repository_rule_error(repository, config, rule_cls):
     assert "Rule execution failed" in results["G001"].message
 
 
-def test_lint_repositories_with_missing_rule_set(repository, config, rule_manager):
+def test_lint_repositories_with_missing_rule_set(
+    mocker, repository, config, rule_manager
+):
     """Test linting repositories when rule set is not found."""
     # Setup mock rule manager to return no rule set
     rule_manager.get.return_value = None
 
     # Create linter and lint repositories
     linter = Linter(config)
+    create_context = mocker.spy(linter, "create_context")
     results = linter.lint_repositories([repository])
 
     # Verify error is reported in results
@@ -190,6 +230,8 @@ def test_lint_repositories_with_missing_rule_set(repository, config, rule_manage
     assert "error" in results["test-repo"]
     assert "No rule set found" in results["test-repo"]["error"]
     rule_manager.get.assert_called_once_with("empty")
+    # No context is created for a repository without a rule set
+    create_context.assert_not_called()
 
 
 def test_lint_repositories_success(repository, config, ruleset, rule_manager):
@@ -210,7 +252,63 @@ def test_lint_repositories_success(repository, config, ruleset, rule_manager):
     assert not repo_results["G001"].fix_available
 
 
-def test_lint_repositories_output_formatting(repository, config, capsys, rule_cls):
+def test_lint_repositories_concurrently(config, ruleset, rule_manager, capsys):
+    """Test that concurrently linted repositories report in the given order."""
+    rule_manager.get.return_value = ruleset
+    repositories = []
+    for i in range(5):
+        repository = MagicMock()
+        repository.name = f"repo-{i}"
+        repositories.append(repository)
+
+    linter = Linter(config, max_workers=4)
+    results = linter.lint_repositories(repositories)
+
+    assert list(results) == [repository.name for repository in repositories]
+    assert all(
+        result["G001"].result == RuleResult.PASSED for result in results.values()
+    )
+    captured = capsys.readouterr()
+    headers = [
+        line
+        for line in strip_color_codes(captured.out).splitlines()
+        if line.startswith("- ")
+    ]
+    assert headers == [
+        f"- {repository.name} ({config.default_ruleset})" for repository in repositories
+    ]
+
+
+def test_lint_repositories_concurrently_with_error(
+    config, ruleset, rule_manager, capsys
+):
+    """Test that an error in one worker is raised after all output is written."""
+
+    def get(rule_set_id):
+        if rule_set_id == "broken":
+            raise RuntimeError("Rule manager failure")
+        return ruleset
+
+    rule_manager.get.side_effect = get
+    config.repositories = {"repo-2": RepositoryConfig(ruleset="broken")}
+    repositories = [_Repo(name=f"repo-{i}") for i in range(5)]
+
+    linter = Linter(config, max_workers=4)
+    with pytest.raises(RuntimeError, match="Rule manager failure"):
+        linter.lint_repositories(repositories)
+
+    captured = capsys.readouterr()
+    headers = [
+        line
+        for line in strip_color_codes(captured.out).splitlines()
+        if line.startswith("- ")
+    ]
+    assert headers == [f"- repo-{i} ({config.default_ruleset})" for i in (0, 1, 3, 4)]
+
+
+def test_lint_repositories_output_formatting(
+    repository, config, rule_manager, capsys, rule_cls
+):
     """Test output formatting of lint results."""
     # Create rules with different results
     passing_rule = rule_cls("G001", "Passing rule")
@@ -247,19 +345,17 @@ def test_lint_repositories_output_formatting(repository, config, capsys, rule_cl
     config.default_ruleset = "test"
 
     # Setup mock rule manager to return our rule set
-    rule_manager = MagicMock()
     rule_manager.get.return_value = rule_set
 
     # Create linter with mocked rule manager
     linter = Linter(config)
-    linter._rule_manager = rule_manager
 
     # Run linting
     linter.lint_repositories([repository])
 
     # Capture output and strip color codes
     captured = capsys.readouterr()
-    output_lines = [strip_color_codes(line) for line in captured.out.splitlines()]
+    output_lines = strip_color_codes(captured.out).splitlines()
 
     # Verify output format
     assert output_lines[0] == f"- {repository.name} (test)"
@@ -270,7 +366,7 @@ def test_lint_repositories_output_formatting(repository, config, capsys, rule_cl
 
 
 def test_lint_repositories_output_formatting_with_fix(
-    repository, config, capsys, rule_cls
+    repository, config, rule_manager, capsys, rule_cls
 ):
     """Test output formatting of lint results with a fixable rule."""
     # Create a rule set with a fixable rule
@@ -292,19 +388,17 @@ def test_lint_repositories_output_formatting_with_fix(
     config.default_ruleset = "test"
 
     # Setup mock rule manager to return our rule set
-    rule_manager = MagicMock()
     rule_manager.get.return_value = rule_set
 
     # Create linter with mocked rule manager
     linter = Linter(config)
-    linter._rule_manager = rule_manager
 
     # Run linting
     linter.lint_repositories([repository])
 
     # Capture output and strip color codes
     captured = capsys.readouterr()
-    output_lines = [strip_color_codes(line) for line in captured.out.splitlines()]
+    output_lines = strip_color_codes(captured.out).splitlines()
 
     # Verify output format
     assert output_lines[0] == f"- {repository.name} (test)"
@@ -313,7 +407,9 @@ def test_lint_repositories_output_formatting_with_fix(
     assert "This can be fixed automatically" in output_lines[2]  # Fix description
 
 
-def test_lint_repositories_custom_error_message(repository, config, capsys, rule_cls):
+def test_lint_repositories_custom_error_message(
+    repository, config, rule_manager, capsys, rule_cls
+):
     """Test output formatting of lint results with a custom error message."""
     error_message = "Custom error occurred while checking rule"
 
@@ -325,12 +421,10 @@ def test_lint_repositories_custom_error_message(repository, config, capsys, rule
     config.default_ruleset = "test"
 
     # Setup mock rule manager to return our rule set
-    rule_manager = MagicMock()
     rule_manager.get.return_value = rule_set
 
     # Create linter with mocked rule manager
     linter = Linter(config)
-    linter._rule_manager = rule_manager
 
     # Run linting
     results = linter.lint_repositories([repository])
@@ -344,7 +438,7 @@ def test_lint_repositories_custom_error_message(repository, config, capsys, rule
 
     # Verify error output format
     captured = capsys.readouterr()
-    output_lines = [strip_color_codes(line) for line in captured.out.splitlines()]
+    output_lines = strip_color_codes(captured.out).splitlines()
     assert output_lines[0] == f"- {repository.name} (test)"
     assert "Error executing rule G001" in output_lines[1]
     assert error_message in output_lines[1]
@@ -352,19 +446,17 @@ def test_lint_repositories_custom_error_message(repository, config, capsys, rule
     assert "Rule execution failed" in output_lines[2]
 
 
-def test_lint_repositories_no_rule_set_found(repository, config, capsys):
+def test_lint_repositories_no_rule_set_found(repository, config, rule_manager, capsys):
     """Test output formatting when no rule set is found."""
     # Configure mock config with non-existent rule set
     config.default_ruleset = "non-existent"
     config.repositories = {}
 
     # Setup mock rule manager to return no rule set
-    rule_manager = MagicMock()
-    rule_manager.get_rule_set.return_value = None
+    rule_manager.get.return_value = None
 
     # Create linter with mocked rule manager
     linter = Linter(config)
-    linter._rule_manager = rule_manager
 
     # Run linting
     results = linter.lint_repositories([repository])
@@ -375,10 +467,25 @@ def test_lint_repositories_no_rule_set_found(repository, config, capsys):
 
     # Verify error output format
     captured = capsys.readouterr()
-    output_lines = [strip_color_codes(line) for line in captured.out.splitlines()]
+    output_lines = strip_color_codes(captured.out).splitlines()
     assert output_lines[0] == f"- {repository.name} (no rule set)"
 
 
+@pytest.fixture(scope="module")
+def fixable_rule_set(rule_cls):
+    """Create a rule set with a single fixable rule, shared by the module."""
+    rule_set = RuleSet("test", "Test rule set")
+    rule_set.add(
+        rule_cls(
+            "test.rule",
+            "Test rule",
+            result=_FIXABLE_RESULT,
+            fix=lambda context: (True, "Mock fix applied"),
+        )
+    )
+    return rule_set
+
+
 @pytest.mark.parametrize(
     "non_interactive,user_input,expected_fix",
     [
@@ -390,32 +497,17 @@ def test_lint_repositories_no_rule_set_found(repository, config, capsys):
 def test_lint_repositories_fix_interaction(
     repository,
     config,
+    rule_manager,
     capsys,
     monkeypatch,
     non_interactive,
     user_input,
     expected_fix,
-    rule_cls,
+    fixable_rule_set,
 ):
     """Test interactive and non-interactive fix modes."""
-    # Create a rule set with a fixable rule
-    rule = rule_cls(
-        "test.rule",
-        "Test rule",
-        result=RuleCheckResult(
-            result=RuleResult.FAILED,
-            message="Rule failed but can be fixed",
-            fix_available=True,
-            fix_description="This can be fixed automatically",
-        ),
-        fix=lambda context: (True, "Mock fix applied"),
-    )
-    rule_set = RuleSet("test", "Test rule set")
-    rule_set.add(rule)
-
     # Mock rule manager
-    rule_manager = MagicMock()
-    rule_manager.get.return_value = rule_set
+    rule_manager.get.return_value = fixable_rule_set
 
     # Mock user input
     mock_input = MagicMock(return_value=user_input.strip())
@@ -426,7 +518,6 @@ def test_lint_repositories_fix_interaction(
 
     # Create linter with mocked components
     linter = Linter(config, dry_run=False, non_interactive=non_interactive, fix=True)
-    linter._rule_manager = rule_manager
 
     # Run linting
     linter.lint_repositories([repository])
@@ -439,197 +530,189 @@ def test_lint_repositories_fix_interaction(
         assert "Fix skipped" in strip_color_codes(captured.out)
 
 
-def test_lint_repositories_fix_error(repository, config, capsys):
+def test_lint_repositories_fix_error(
+    repository, config, rule_manager, capsys, rule_cls
+):
     """Test handling of errors during fix application."""
 
-    class R(Rule):
-        _id = "G001"
-        _description = "Test rule"
-
-        def __init__(self):
-            super().__init__()
-            self._check_count = 0
-
-        def check(self, context: RuleContext) -> RuleCheckResult:
-            return RuleCheckResult(
-                result=RuleResult.FAILED,
-                message="Rule failed but can be fixed",
-                fix_available=True,
-                fix_description="This can be fixed automatically",
-            )
+    def fix(context: RuleContext) -> tuple[bool, str]:
+        raise CustomException("Error during fix")
 
-        def fix(self, context: RuleContext) -> tuple[bool, str]:
-            raise CustomException("Error during fix")
+    R = rule_cls("G001", "Test rule", _FIXABLE_RESULT, fix)
 
     # Setup rule set with a rule that fails during fix
     rule_set = RuleSet("test", "Test rule set")
     rule_set.add(R)
 
     # Setup rule manager
-    mock_manager = MagicMock()
-    mock_manager.get.return_value = rule_set
-    with patch("lintr.linter.RuleManager", return_value=mock_manager):
-        # Run linter in non-interactive mode to trigger fix
-        linter = Linter(config, non_interactive=True, fix=True)
-        linter.lint_repositories([repository])
-
-        # Check output
-        captured = capsys.readouterr()
-        output = strip_color_codes(captured.out)
-        assert "✗ G001: Rule failed but can be fixed" in output
-        assert "⚡ This can be fixed automatically" in output
-        assert "⚡ Fix error: Error during fix" in output
-
-
-def test_lint_repositories_recheck_error(repository, config, capsys):
-    """Test handling of errors during recheck after fix."""
+    rule_manager.get.return_value = rule_set
+
+    # Run linter in non-interactive mode to trigger fix
+    linter = Linter(config, non_interactive=True, fix=True)
+    linter.lint_repositories([repository])
+
+    # Check output
+    captured = capsys.readouterr()
+    output = strip_color_codes(captured.out)
+    assert "✗ G001: Rule failed but can be fixed" in output
+    assert "⚡ This can be fixed automatically" in output
+    assert "⚡ Fix error: Error during fix" in output
+
+
+@pytest.mark.parametrize("raises", [False, True], ids=["failed", "error"])
+def test_lint_repositories_failed_fix_refreshes_context(
+    config, rule_manager, rule_cls, raises
+):
+    """Test that later rules observe changes made by a fix that did not succeed."""
+    branches = [MagicMock()]
+    repository = MagicMock()
+    repository.name = "test-repo"
+    repository.get_branches.side_effect = lambda: iter(list(branches))
+
+    def check(context: RuleContext) -> RuleCheckResult:
+        return RuleCheckResult(
+            result=RuleResult.FAILED,
+            message=f"{len(context.branches)} branches",
+            fix_available=True,
+            fix_description="Add a branch",
+        )
+
+    def fix(context: RuleContext) -> tuple[bool, str]:
+        # Partially change the repository before failing
+        branches.append(MagicMock())
+        if raises:
+            raise CustomException("Error during fix")
+        return False, "Fix failed for some reason"
 
-    class R(Rule):
-        _id = "G001"
-        _description = "Test rule"
+    def count_branches(context: RuleContext) -> RuleCheckResult:
+        return RuleCheckResult(RuleResult.PASSED, f"{len(context.branches)} branches")
 
-        def __init__(self):
-            super().__init__()
-            self._check_count = 0
+    rule_set = RuleSet("test", "Test rule set")
+    rule_set.add(rule_cls("G001", "Fixable rule", check, fix))
+    rule_set.add(rule_cls("G002", "Branch count rule", count_branches))
+    rule_manager.get.return_value = rule_set
+
+    linter = Linter(config, non_interactive=True, fix=True)
+    results = linter.lint_repositories([repository])
 
-        def check(self, context: RuleContext) -> RuleCheckResult:
-            self._check_count += 1
+    assert results["test-repo"]["G002"].message == "2 branches"
+
+
+def test_lint_repositories_recheck_error(
+    repository, config, rule_manager, capsys, rule_cls
+):
+    """Test handling of errors during recheck after fix."""
+    check_count = 0
 
-            # First check always returns failed with fix available
-            if self._check_count == 1:
-                return RuleCheckResult(
-                    result=RuleResult.FAILED,
-                    message="Rule failed but can be fixed",
-                    fix_available=True,
-                    fix_description="This can be fixed automatically",
-                )
+    def check(context: RuleContext) -> RuleCheckResult:
+        nonlocal check_count
+        check_count += 1
 
-            raise CustomException("Error during recheck after fix")
+        # First check always returns failed with fix available
+        if check_count == 1:
+            return _FIXABLE_RESULT
 
-        def fix(self, context: RuleContext) -> tuple[bool, str]:
-            return True, "Mock fix applied"
+        raise CustomException("Error during recheck after fix")
+
+    R = rule_cls("G001", "Test rule", check, lambda context: (True, "Mock fix applied"))
 
     # Setup rule set with a rule that fails during recheck
     rule_set = RuleSet("test", "Test rule set")
     rule_set.add(R)
 
     # Setup rule manager
-    mock_manager = MagicMock()
-    mock_manager.get.return_value = rule_set
-    with patch("lintr.linter.RuleManager", return_value=mock_manager):
-        # Run linter in non-interactive mode to trigger fix
-        linter = Linter(config, non_interactive=True, fix=True)
-        linter.lint_repositories([repository])
-
-        # Check output
-        captured = capsys.readouterr()
-        output = strip_color_codes(captured.out)
-        assert "✗ G001: Rule failed but can be fixed" in output
-        assert "⚡ This can be fixed automatically" in output
-        assert "⚡ Fixed: Mock fix applied" in output
-        assert "Fix error: Error during recheck after fix" in output
-
-
-def test_lint_repositories_fix_error_with_failed_fix(repository, config, capsys):
-    """Test handling of failed fixes (non-exception case)."""
+    rule_manager.get.return_value = rule_set
 
-    # Create a rule that returns success=False from fix
-    class FailedFixRule(Rule):
-        _id = "G001"
-        _description = "Test rule"
+    # Run linter in non-interactive mode to trigger fix
+    linter = Linter(config, non_interactive=True, fix=True)
+    linter.lint_repositories([repository])
 
-        def check(self, context: RuleContext) -> RuleCheckResult:
-            return RuleCheckResult(
-                result=RuleResult.FAILED,
-                message="Rule failed but can be fixed",
-                fix_available=True,
-                fix_description="This can be fixed automatically",
-            )
+    # Check output
+    captured = capsys.readouterr()
+    output = strip_color_codes(captured.out)
+    assert "✗ G001: Rule failed but can be fixed" in output
+    assert "⚡ This can be fixed automatically" in output
+    assert "⚡ Fixed: Mock fix applied" in output
+    assert "Fix error: Error during recheck after fix" in output
 
-        def fix(self, context: RuleContext) -> tuple[bool, str]:
-            return False, "Fix failed for some reason"
+
+def test_lint_repositories_fix_error_with_failed_fix(
+    repository, config, rule_manager, capsys, rule_cls
+):
+    """Test handling of failed fixes (non-exception case)."""
+    # Create a rule that returns success=False from fix
+    FailedFixRule = rule_cls(
+        "G001",
+        "Test rule",
+        _FIXABLE_RESULT,
+        lambda context: (False, "Fix failed for some reason"),
+    )
 
     # Setup rule set with our test rule
     rule_set = RuleSet("test", "Test rule set")
     rule_set.add(FailedFixRule)
 
     # Setup rule manager
-    mock_manager = MagicMock()
-    mock_manager.get.return_value = rule_set
-    with patch("lintr.linter.RuleManager", return_value=mock_manager):
-        # Run linter in non-interactive mode to trigger fix
-        linter = Linter(config, non_interactive=True, fix=True)
-        linter.lint_repositories([repository])
+    rule_manager.get.return_value = rule_set
 
-        # Check output
-        captured = capsys.readouterr()
-        output = strip_color_codes(captured.out)
-        assert "✗ G001: Rule failed but can be fixed" in output
-        assert "⚡ This can be fixed automatically" in output
-        assert "⚡ Fix failed: Fix failed for some reason" in output
+    # Run linter in non-interactive mode to trigger fix
+    linter = Linter(config, non_interactive=True, fix=True)
+    linter.lint_repositories([repository])
 
+    # Check output
+    captured = capsys.readouterr()
+    output = strip_color_codes(captured.out)
+    assert "✗ G001: Rule failed but can be fixed" in output
+    assert "⚡ This can be fixed automatically" in output
+    assert "⚡ Fix failed: Fix failed for some reason" in output
 
+
+@pytest.mark.parametrize(
+    "result", [RuleResult.PASSED, RuleResult.FAILED, RuleResult.SKIPPED]
+)
 def test_lint_repositories_fix_with_all_rule_results(
-    repository, config, capsys, rule_cls
+    repository, config, rule_manager, capsys, rule_cls, result
 ):
     """Test handling of all possible rule results after fix."""
+    fixed = False
+
+    def check(context: RuleContext) -> RuleCheckResult:
+        if not fixed:
+            return _FIXABLE_RESULT
+        return RuleCheckResult(
+            result=result,
+            message=f"Rule returned {result} after fix",
+            fix_available=False,
+        )
 
-    class MultiResultRule(Rule, ABC):
-        _result = RuleResult.PASSED
-        _fixed = False
-
-        def check(self, context: RuleContext) -> RuleCheckResult:
-            if not self._fixed:
-                return RuleCheckResult(
-                    result=RuleResult.FAILED,
-                    message="Rule failed but can be fixed",
-                    fix_available=True,
-                    fix_description="This can be fixed automatically",
-                )
-            return RuleCheckResult(
-                result=self._result,
-                message=f"Rule returned {self._result} after fix",
-                fix_available=False,
-            )
-
-        def fix(self, context: RuleContext) -> tuple[bool, str]:
-            self._fixed = True
-            return True, "Fix applied"
-
-    # Test each possible result type
-    for result in [RuleResult.PASSED, RuleResult.FAILED, RuleResult.SKIPPED]:
-        # Setup rule set with a rule that returns our test result
-        rule_set = RuleSet("test", "Test rule set")
-
-        class MyRule(MultiResultRule):
-            _id = "G001"
-            _description = "Test rule"
-            _result = result
-
-        rule_set.add(MyRule)
-
-        # Setup rule manager
-        mock_manager = MagicMock()
-        mock_manager.get.return_value = rule_set
-        with patch("lintr.linter.RuleManager", return_value=mock_manager):
-            # Run linter in non-interactive mode to trigger fix
-            linter = Linter(config, non_interactive=True, fix=True)
-            linter.lint_repositories([repository])
-
-            # Check output
-            captured = capsys.readouterr()
-            output = strip_color_codes(captured.out)
-            assert "Rule returned" in output
-            if result == RuleResult.PASSED:
-                assert "✓" in output
-            elif result == RuleResult.FAILED:
-                assert "✗" in output
-            else:  # SKIPPED
-                assert "-" in output
+    def fix(context: RuleContext) -> tuple[bool, str]:
+        nonlocal fixed
+        fixed = True
+        return True, "Fix applied"
+
+    # Setup rule set with a rule that returns our test result
+    rule_set = RuleSet("test", "Test rule set")
+    rule_set.add(rule_cls("G001", "Test rule", check, fix))
+    rule_manager.get.return_value = rule_set
+
+    # Run linter in non-interactive mode to trigger fix
+    linter = Linter(config, non_interactive=True, fix=True)
+    linter.lint_repositories([repository])
+
+    # Check output
+    captured = capsys.readouterr()
+    output = strip_color_codes(captured.out)
+    assert "Rule returned" in output
+    if result == RuleResult.PASSED:
+        assert "✓" in output
+    elif result == RuleResult.FAILED:
+        assert "✗" in output
+    else:  # SKIPPED
+        assert "-" in output
 
 
 def test_lint_repositories_no_fix_prompt_without_fix_flag(
-    repository, config, capsys, rule_cls
+    repository, config, rule_manager, capsys, rule_cls
 ):
     """Test that fix prompts are not shown when --fix is not provided."""
     # Create a rule set with a fixable rule
@@ -647,7 +730,6 @@ def test_lint_repositories_no_fix_prompt_without_fix_flag(
     rule_set.add(rule)
 
     # Mock rule manager
-    rule_manager = MagicMock()
     rule_manager.get.return_value = rule_set
 
     # Mock repository name and context
@@ -656,7 +738,6 @@ def test_lint_repositories_no_fix_prompt_without_fix_flag(
 
     # Create linter with mocked components (fix=False)
     linter = Linter(config, dry_run=False, non_interactive=False, fix=False)
-    linter._rule_manager = rule_manager
 
     # Mock create_context to return a RuleContext
     context = RuleContext(repository, config)